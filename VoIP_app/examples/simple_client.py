@@ -1,6 +1,7 @@
 import sys
 import time
 import os
+import pyaudio
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.audio.capture import AudioCapture
@@ -47,33 +48,38 @@ def main():
         print("No output devices found!")
         return
 
-    # Reinitialize with selected devices
-    capture = AudioCapture(
+    # Switch to the selected devices
+    capture.reconfigure(
         device_index=input_device,
         rate=input_rate,
         channels=1
     )
-    playback = AudioPlayback(
+    playback.reconfigure(
         device_index=output_device,
         rate=output_rate,
         channels=2 if output_rate >= 44100 else 1
     )
 
+    # PortAudio drives both streams; the output callback plays whatever the
+    # capture callback has queued, falling back to silence
+    silence = bytes(playback.FRAME_SIZE * playback.CHANNELS * 2)
+
+    def on_playback(in_data, frame_count, time_info, status):
+        chunk = capture.pop_chunk()
+        return (chunk if chunk is not None else silence, pyaudio.paContinue)
+
     # Start streams
-    if not capture.start_stream():
+    if not capture.start_callback_stream():
         print("Failed to start input stream")
         return
-    if not playback.start_stream():
+    if not playback.start_stream(stream_callback=on_playback):
         print("Failed to start output stream")
         return
 
     print("\nStreaming audio... (Press Ctrl+C to stop)")
     try:
-        while True:
-            frame = capture.read_frame()
-            if frame:
-                playback.play_frame(frame)
-            time.sleep(0.001)
+        while capture.stream.is_active() and playback.stream.is_active():
+            time.sleep(0.1)
     except KeyboardInterrupt:
         print("\nStopping...")
     finally:
@@ -1,6 +1,6 @@
-import time
 import sys
 import os
+import numpy as np
 
 # Add the project root directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.audio.capture import AudioCapture
 from src.audio.playback import AudioPlayback
 
+STATS_INTERVAL = 25  # Frames between stats printouts (20 ms frames)
+
 def print_progress_bar(progress, length=50):
     """Print a progress bar"""
     filled = int(length * progress)
@@ -17,12 +19,13 @@ def print_progress_bar(progress, length=50):
 
 def main():
     # Initialize audio components with larger buffer
-    capture = AudioCapture(chunk_size=320, channels=1, rate=16000)
-    playback = AudioPlayback(chunk_size=320, channels=1, rate=16000)
+    capture = AudioCapture(channels=1, rate=16000)
+    playback = AudioPlayback(channels=1, rate=16000)
+    frame_handler = playback.frame_handler
     
     print("🎙️  Starting audio test... Press Ctrl+C to stop")
     print("Monitoring audio chunks and frame handling...")
-    print("Buffer size: 10 frames")
+    print(f"Buffer size: {frame_handler.buffer_size} frames")
     
     try:
         # Start streams
@@ -34,44 +37,44 @@ def main():
         for _ in range(5):  # Fill half the buffer
             frame = capture.read_frame()
             if frame:
-                playback.frame_handler.add_frame(frame)
-                time.sleep(0.02)  # 20ms delay
+                frame_handler.add_frame(frame)
         
         print("Buffer filled, starting playback...")
         
         while True:
-            # Read a new frame
+            # Read a new frame; the blocking read paces the loop
             frame = capture.read_frame()
             
             if frame:
-                # Get audio level
-                audio_level = capture.get_audio_level(frame.data)
-                
-                # Get frame statistics
-                stats = capture.get_frame_statistics()
-                
-                # Clear line and print stats
-                sys.stdout.write('\r' + ' ' * 80 + '\r')  # Clear line
-                print(f"\nFrame #{frame.sequence_number}")
-                print(f"Timestamp: {frame.timestamp:.3f}")
-                print(f"Audio Level: {audio_level:.2f}")
-                print(f"Buffer Level: {stats['buffer_level']:.1%}")
-                print(f"Frames Processed: {stats['frames_processed']}")
-                print(f"Frames Dropped: {stats['frames_dropped']}")
-                
-                # Print buffer visualization
-                print_progress_bar(stats['buffer_level'])
+                # Report twice a second rather than on every frame
+                if frame.sequence_number % STATS_INTERVAL == 0:
+                    # Get audio level (mean absolute amplitude)
+                    audio_level = np.abs(np.frombuffer(frame.data, dtype=np.int16).astype(np.int32)).mean()
+                    
+                    # Get frame statistics
+                    stats = frame_handler.get_statistics()
+                    buffer_fill = stats['buffer_level'] / frame_handler.buffer_size
+                    
+                    # Clear line and print stats
+                    sys.stdout.write('\r' + ' ' * 80 + '\r')  # Clear line
+                    print(f"\nFrame #{frame.sequence_number}")
+                    print(f"Timestamp: {frame.timestamp:.3f}")
+                    print(f"Audio Level: {audio_level:.2f}")
+                    print(f"Buffer Level: {buffer_fill:.1%}")
+                    print(f"Frames Processed: {capture.frame_handler.frame_count}")
+                    print(f"Frames Dropped: {frame_handler.buffer_overflow_count}")
+                    print(f"Jitter: {stats['current_jitter'] * 1000:.2f} ms")
+                    
+                    # Print buffer visualization
+                    print_progress_bar(buffer_fill)
                 
                 # Add frame to buffer
-                playback.frame_handler.add_frame(frame)
+                frame_handler.add_frame(frame)
                 
                 # Try to play a frame from buffer
-                next_frame = playback.frame_handler.get_next_frame()
+                next_frame = frame_handler.get_next_frame()
                 if next_frame:
-                    playback.stream.write(next_frame.data, playback.CHUNK)
-            
-            # Small delay to prevent CPU overload
-            time.sleep(0.01)
+                    playback.stream.write(next_frame.data, playback.FRAME_SIZE)
             
     except KeyboardInterrupt:
         print("\n\n🛑 Stopping audio test...")
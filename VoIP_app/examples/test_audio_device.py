@@ -1,6 +1,8 @@
 import sys
 import time
+from collections import deque
 from pathlib import Path
+import pyaudio
 
 # Add the src directory to Python path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -12,8 +14,8 @@ def test_audio_device():
     print("Testing audio device functionality...")
     
     try:
-        # Initialize audio device
-        device = AudioDevice()
+        # Initialize audio device, moving 4 chunks per callback
+        device = AudioDevice(buffer_chunks=4)
         print("✓ Successfully initialized AudioDevice")
         
         # List available devices
@@ -24,14 +26,25 @@ def test_audio_device():
             print(f"  Input channels: {in_channels}")
             print(f"  Output channels: {out_channels}")
         
+        # Captured chunks are handed to the output callback through a ring
+        ring = deque(maxlen=10)
+        silence = bytes(device.frames_per_buffer * device.channels * 2)
+
+        def on_capture(in_data, frame_count, time_info, status):
+            ring.append(in_data)
+            return (None, pyaudio.paContinue)
+
+        def on_playback(in_data, frame_count, time_info, status):
+            return (ring.popleft() if ring else silence, pyaudio.paContinue)
+
         # Start capture
-        if not device.start_capture():
+        if not device.start_capture(stream_callback=on_capture):
             print("✗ Failed to start audio capture")
             return False
         print("✓ Started audio capture")
         
         # Start playback
-        if not device.start_playback():
+        if not device.start_playback(stream_callback=on_playback):
             print("✗ Failed to start audio playback")
             return False
         print("✓ Started audio playback")
@@ -40,13 +53,7 @@ def test_audio_device():
         print("\nRecording and playing audio for 5 seconds...")
         print("Please speak into your microphone")
         
-        start_time = time.time()
-        while time.time() - start_time < 5:
-            # Read audio chunk
-            chunk = device.read_chunk()
-            if chunk:
-                # Play the chunk
-                device.write_chunk(chunk)
+        time.sleep(5)
         
         print("✓ Completed audio test")
         
@@ -21,9 +21,13 @@ def test_opus_codec():
         # Create a test audio signal (1 second of 440 Hz sine wave)
         sample_rate = codec.rate
         duration = 1.0  # seconds
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        test_signal = np.sin(2 * np.pi * 440 * t) * 32767  # Scale to int16 range
-        test_signal = test_signal.astype(np.int16)
+        # One sine period as an int16 lookup table, indexed by an integer
+        # phase accumulator instead of evaluating sin() per sample
+        lut_size = 1024
+        lut = (np.sin(np.arange(lut_size) * 2 * np.pi / lut_size) * 32767).astype(np.int16)
+        # int64: n * 440 * lut_size passes 2**31 (arange is int32 on Windows)
+        phase = np.arange(int(sample_rate * duration), dtype=np.int64) * 440 * lut_size // sample_rate
+        test_signal = lut[phase % lut_size]
         
         # Convert to bytes
         audio_data = test_signal.tobytes()
@@ -32,54 +36,36 @@ def test_opus_codec():
         # Split audio into frames
         frame_size = codec.frame_size
         num_frames = len(test_signal) // frame_size
-        encoded_frames = []
-        decoded_frames = []
+        decoded_data = bytearray()  # Decoded PCM, appended frame by frame
         
-        # Process each frame
-        for i in range(num_frames):
-            start = i * frame_size
-            end = start + frame_size
-            frame = test_signal[start:end]
-            
-            # Ensure frame is the correct size
-            if len(frame) != frame_size:
-                print(f"✗ Frame size mismatch: got {len(frame)}, expected {frame_size}")
-                return False
-            
-            # Convert frame to bytes for encoding
-            frame_bytes = frame.tobytes()
-            
-            # Encode frame
+        # Encode every frame in one call
+        try:
+            encoded_frames = codec.encode_batch(audio_data)
+        except Exception as e:
+            print(f"✗ Error encoding frames: {str(e)}")
+            return False
+        if len(encoded_frames) != num_frames or not all(encoded_frames):
+            print("✗ Failed to encode frame")
+            return False
+        
+        # Decode each frame
+        for encoded_frame in encoded_frames:
             try:
-                # Pass frame size in samples to the encoder
-                encoded_frame = codec.encoder.encode(frame_bytes, frame_size)
-                if encoded_frame:
-                    encoded_frames.append(encoded_frame)
-                    # Decode frame
-                    decoded_frame = codec.decoder.decode(encoded_frame, frame_size)
-                    if decoded_frame:
-                        decoded_frames.append(decoded_frame)
-                    else:
-                        print("✗ Failed to decode frame")
-                        return False
-                else:
-                    print("✗ Failed to encode frame")
-                    return False
+                decoded_frame = codec.decoder.decode(encoded_frame, frame_size)
             except Exception as e:
-                print(f"✗ Error processing frame: {str(e)}")
-                print(f"Frame size: {len(frame)} samples")
-                print(f"Frame bytes size: {len(frame_bytes)} bytes")
+                print(f"✗ Error decoding frame: {str(e)}")
                 return False
+            if not decoded_frame:
+                print("✗ Failed to decode frame")
+                return False
+            decoded_data.extend(decoded_frame)
         
-        if not encoded_frames or not decoded_frames:
+        if not encoded_frames or not decoded_data:
             print("✗ No frames were processed successfully")
             return False
             
         print("✓ Successfully encoded and decoded all frames")
         
-        # Combine decoded frames
-        decoded_data = b''.join(decoded_frames)
-        
         # Save the original and decoded audio for comparison
         def save_wav(data, filename):
             with wave.open(str(filename), 'wb') as wf:  # Convert Path to string
@@ -1,9 +1,35 @@
 # src/audio/audio_device.py
 import pyaudio
 import numpy as np
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, NamedTuple
 import wave
 import time
+import weakref
+
+SUPPORTED_RATES = (8000, 16000, 44100, 48000)  # Offered for every device, not probed
+
+class DeviceInfo(NamedTuple):
+    index: int
+    name: str
+    channels: int
+    rates: Tuple[int, ...]
+
+# Device info per PyAudio instance; PortAudio is only queried again after
+# invalidate_device_cache(). Weak keys so an entry goes away with its instance
+# and a new instance can never pick up a stale list
+_DEVICE_CACHE: "weakref.WeakKeyDictionary[pyaudio.PyAudio, List[dict]]" = weakref.WeakKeyDictionary()
+
+def enumerate_devices(p: pyaudio.PyAudio) -> List[dict]:
+    """Return the device info dicts for a PyAudio instance, querying PortAudio once"""
+    devices = _DEVICE_CACHE.get(p)
+    if devices is None:
+        devices = [p.get_device_info_by_index(i) for i in range(p.get_device_count())]
+        _DEVICE_CACHE[p] = devices
+    return devices
+
+def invalidate_device_cache(p: pyaudio.PyAudio):
+    """Drop the cached enumeration so the next listing rescans the devices"""
+    _DEVICE_CACHE.pop(p, None)
 
 class AudioDevice:
     def __init__(self, 
@@ -11,7 +37,8 @@ class AudioDevice:
                  output_device_index: Optional[int] = None,
                  sample_rate: int = 16000,
                  channels: int = 1,
-                 chunk_size: int = 320):
+                 chunk_size: int = 320,
+                 buffer_chunks: int = 1):
         """
         Initialize audio device for capture and playback
         
@@ -21,10 +48,13 @@ class AudioDevice:
             sample_rate: Audio sample rate in Hz
             channels: Number of audio channels
             chunk_size: Size of audio chunks in samples
+            buffer_chunks: Chunks per PortAudio buffer; in callback mode each
+                callback then carries this many chunks at once
         """
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_size = chunk_size
+        self.frames_per_buffer = chunk_size * buffer_chunks
         self.format = pyaudio.paInt16
         
         # Initialize PyAudio
@@ -38,25 +68,20 @@ class AudioDevice:
         self.input_stream = None
         self.output_stream = None
         
-        # Buffer for playback
-        self.playback_buffer = []
-        self.is_playing = False
-        
     def list_devices(self) -> List[Tuple[int, str, int, int]]:
         """List all available audio devices"""
         devices = []
-        for i in range(self.p.get_device_count()):
-            dev_info = self.p.get_device_info_by_index(i)
+        for dev_info in enumerate_devices(self.p):
             devices.append((
-                i,
+                dev_info['index'],
                 dev_info['name'],
                 dev_info['maxInputChannels'],
                 dev_info['maxOutputChannels']
             ))
         return devices
     
-    def start_capture(self) -> bool:
-        """Start audio capture"""
+    def start_capture(self, stream_callback=None) -> bool:
+        """Start audio capture, in PortAudio callback mode if stream_callback is given"""
         try:
             self.input_stream = self.p.open(
                 format=self.format,
@@ -64,15 +89,16 @@ class AudioDevice:
                 rate=self.sample_rate,
                 input=True,
                 input_device_index=self.input_device_index,
-                frames_per_buffer=self.chunk_size
+                frames_per_buffer=self.frames_per_buffer,
+                stream_callback=stream_callback
             )
             return True
         except Exception as e:
             print(f"Error starting capture: {str(e)}")
             return False
     
-    def start_playback(self) -> bool:
-        """Start audio playback"""
+    def start_playback(self, stream_callback=None) -> bool:
+        """Start audio playback, in PortAudio callback mode if stream_callback is given"""
         try:
             self.output_stream = self.p.open(
                 format=self.format,
@@ -80,7 +106,8 @@ class AudioDevice:
                 rate=self.sample_rate,
                 output=True,
                 output_device_index=self.output_device_index,
-                frames_per_buffer=self.chunk_size
+                frames_per_buffer=self.frames_per_buffer,
+                stream_callback=stream_callback
             )
             return True
         except Exception as e:
@@ -126,6 +153,7 @@ class AudioDevice:
         """Clean up resources"""
         self.stop_capture()
         self.stop_playback()
+        invalidate_device_cache(self.p)
         self.p.terminate()
     
     def save_to_wav(self, data: bytes, filename: str):
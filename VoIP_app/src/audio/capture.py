@@ -1,7 +1,9 @@
 from typing import Optional
+from collections import deque
 import pyaudio
 from .frame_handler import FrameHandler, AudioFrame
 from .codec import AudioCodec
+from .audio_device import enumerate_devices, invalidate_device_cache, DeviceInfo, SUPPORTED_RATES
 
 class AudioCapture:
     def __init__(self, device_index=None, rate=16000, channels=1):
@@ -13,23 +15,36 @@ class AudioCapture:
         
         self.p = pyaudio.PyAudio()
         self.stream = None
+        self._devices = None  # Cached list_devices() result
+        # Chunks handed over by the PortAudio callback in callback mode
+        self.capture_ring = deque(maxlen=10)
         self.codec = AudioCodec(rate=rate, channels=channels)
         self.frame_handler = FrameHandler(codec=self.codec)
 
+    def reconfigure(self, device_index=None, rate=16000, channels=1):
+        """Select another device/format before start_stream, keeping the PyAudio instance"""
+        self.device_index = device_index
+        if rate != self.RATE or channels != self.CHANNELS:
+            self.RATE = rate
+            self.CHANNELS = channels
+            self.codec = AudioCodec(rate=rate, channels=channels)
+            self.frame_handler = FrameHandler(codec=self.codec)
+
     def list_devices(self):
-        devices = []
-        for i in range(self.p.get_device_count()):
-            dev = self.p.get_device_info_by_index(i)
-            if dev['maxInputChannels'] > 0:
-                devices.append((
-                    i,
-                    dev['name'],
-                    dev['maxInputChannels'],
-                    [8000, 16000, 44100, 48000]  # Supported rates
-                ))
-        return devices
-
-    def start_stream(self, retries=3):
+        if self._devices is None:
+            self._devices = tuple(
+                DeviceInfo(dev['index'], dev['name'], dev['maxInputChannels'], SUPPORTED_RATES)
+                for dev in enumerate_devices(self.p)
+                if dev['maxInputChannels'] > 0
+            )
+        return self._devices
+
+    def refresh_devices(self):
+        """Forget the cached device list so the next list_devices() rescans"""
+        invalidate_device_cache(self.p)
+        self._devices = None
+
+    def start_stream(self, retries=3, stream_callback=None):
         for _ in range(retries):
             try:
                 self.stream = self.p.open(
@@ -38,6 +53,7 @@ class AudioCapture:
                     rate=self.RATE,
                     input=True,
                     input_device_index=self.device_index,
+                    stream_callback=stream_callback,
                     frames_per_buffer=self.CHUNK
                 )
                 return True
@@ -45,6 +61,21 @@ class AudioCapture:
                 print(f"Audio input error: {e}")
         return False
 
+    def start_callback_stream(self, retries=3):
+        """Start capturing in PortAudio callback mode; drain chunks with pop_chunk()"""
+        self.capture_ring.clear()
+        return self.start_stream(retries, stream_callback=self._on_capture)
+
+    def _on_capture(self, in_data, frame_count, time_info, status):
+        # frames_per_buffer matches the Opus frame size, so in_data can go to
+        # the encoder as-is
+        self.capture_ring.append(in_data)
+        return (None, pyaudio.paContinue)
+
+    def pop_chunk(self) -> Optional[bytes]:
+        """Return the oldest chunk captured in callback mode, or None if there is none"""
+        return self.capture_ring.popleft() if self.capture_ring else None
+
     def read_frame(self) -> Optional[AudioFrame]:
         try:
             data = self.stream.read(self.CHUNK, exception_on_overflow=False)
@@ -57,4 +88,5 @@ class AudioCapture:
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
+        invalidate_device_cache(self.p)
         self.p.terminate()
\ No newline at end of file
@@ -13,13 +13,27 @@ class AudioCodec:
 
     def encode(self, pcm_data):
         """Encode PCM data to Opus format"""
-        if isinstance(pcm_data, bytes):
-            pcm = np.frombuffer(pcm_data, dtype=np.int16)
-        else:
-            pcm = pcm_data
-        return self.encoder.encode(pcm, self.frame_size)
+        if not isinstance(pcm_data, bytes):
+            pcm_data = bytes(pcm_data)  # opuslib needs bytes, not any buffer
+        return self.encoder.encode(pcm_data, self.frame_size)
+
+    def encode_batch(self, pcm_data):
+        """Encode consecutive PCM frames to Opus, one packet per frame.
+
+        A trailing partial frame is ignored.
+        """
+        if not isinstance(pcm_data, bytes):
+            pcm_data = bytes(pcm_data)
+        step = self.frame_size * self.channels * 2  # 16-bit samples
+        encode = self.encoder.encode
+        frame_size = self.frame_size
+        return [encode(pcm_data[i:i + step], frame_size)
+                for i in range(0, len(pcm_data) - step + 1, step)]
 
     def decode(self, encoded_data):
         """Decode Opus data to PCM format"""
-        decoded = self.decoder.decode(encoded_data, self.frame_size)
-        return np.array(decoded, dtype=np.int16).tobytes()
\ No newline at end of file
+        return self.decoder.decode(encoded_data, self.frame_size)
+
+    def decode_np(self, encoded_data):
+        """Decode Opus data to an int16 array viewing the decoded bytes (no copy)"""
+        return np.frombuffer(self.decode(encoded_data), dtype=np.int16)
\ No newline at end of file
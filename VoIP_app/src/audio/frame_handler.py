@@ -1,54 +1,111 @@
 import time
 from typing import Optional
 import numpy as np
-from collections import deque
-from dataclasses import dataclass
-import statistics
 
-@dataclass
+# Offset from the monotonic clock to the wall clock, taken once at import
+_WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
 class AudioFrame:
-    data: bytes
-    timestamp: float
-    sequence_number: int
-    sample_rate: int
-    channels: int
-    frame_size: int
-    is_silence: bool = False
+    # One of these is built per 20 ms frame, so it uses __slots__ instead of
+    # a per-instance __dict__ (dataclass(slots=True) would need Python 3.10)
+    __slots__ = ('data', 'timestamp_ns', 'sequence_number', 'sample_rate',
+                 'channels', 'frame_size', 'is_silence')
+
+    def __init__(self, data: bytes, timestamp_ns: int, sequence_number: int,
+                 sample_rate: int, channels: int, frame_size: int,
+                 is_silence: bool = False):
+        self.data = data
+        self.timestamp_ns = timestamp_ns  # time.monotonic_ns() clock
+        self.sequence_number = sequence_number
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.frame_size = frame_size
+        self.is_silence = is_silence
+
+    def __repr__(self):
+        return (f"AudioFrame(sequence_number={self.sequence_number}, "
+                f"timestamp_ns={self.timestamp_ns}, bytes={len(self.data)}, "
+                f"is_silence={self.is_silence})")
+
+    # Field-wise equality (and no hashing), as @dataclass generated
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    @property
+    def timestamp(self) -> float:
+        """Capture time in seconds since the epoch"""
+        return (self.timestamp_ns + _WALL_OFFSET_NS) / 1e9
 
 class FrameHandler:
     def __init__(self, codec, frame_size=320):
         self.codec = codec
         self.frame_size = frame_size
         self.frame_duration = frame_size / codec.rate
+        self.frame_duration_ns = frame_size * 1_000_000_000 // codec.rate
         
-        # Buffer management
-        self.frame_buffer = deque(maxlen=10)
-        self.jitter_buffer = deque(maxlen=5)
-        self.current_jitter = 0.0
+        # Buffer management: fixed-size rings, nothing allocated per frame
+        self.buffer_size = 10
+        self.frame_buffer = [None] * self.buffer_size
+        self._head = 0  # Slot of the oldest buffered frame
+        self._count = 0
+        self.jitter_window = 5
+        self.jitter_buffer = [0] * self.jitter_window  # Nanoseconds
+        self._jidx = 0
+        self._jcount = 0
+        self._jsum = 0  # Running sum of jitter_buffer
+        self.current_jitter_ns = 0
+        self._last_arrival_ns = 0  # When add_frame() last buffered a frame
         self.buffer_underrun_count = 0
         self.buffer_overflow_count = 0
+        self._silence_data = bytes(frame_size * 2)  # Shared by all underrun frames
         
         # Statistics
         self.frame_count = 0
         self.total_bytes = 0
-        self.start_time = time.time()
+        self.start_time_ns = time.monotonic_ns()
         self.silence_threshold = 100
+        # Reused output of np.abs() for the silence gate, with its uint16 view
+        self._abs = np.empty(frame_size * codec.channels, dtype=np.int16)
+        self._abs_u16 = self._abs.view(np.uint16)
+
+        # Frame timestamps are derived from the fixed frame duration; the
+        # clock is only read again every resync_interval frames
+        self.resync_interval = 50
+        self._next_ts_ns = self.start_time_ns
 
     def create_frame(self, data: bytes) -> Optional[AudioFrame]:
         if not data:
             return None
             
         try:
-            audio_data = np.frombuffer(data, dtype=np.int16)
-            rms = np.sqrt(np.mean(audio_data.astype(np.float32)**2))
-            is_silence = rms < self.silence_threshold
+            audio_data = np.frombuffer(data, dtype=np.int16)  # View, no copy
+            # Mean absolute amplitude gate, summed in the integer domain
+            # (uint16 view keeps abs(-32768) from wrapping)
+            if audio_data.shape == self._abs.shape:
+                np.abs(audio_data, out=self._abs)
+                magnitude = self._abs_u16
+            else:
+                magnitude = np.abs(audio_data).view(np.uint16)
+            level = int(magnitude.sum(dtype=np.uint64))
+            is_silence = level < self.silence_threshold * audio_data.shape[0]
         except Exception:
             is_silence = False
+
+        sequence_number = self.frame_count
+        if sequence_number % self.resync_interval == 0:
+            self._next_ts_ns = time.monotonic_ns()
+        timestamp_ns = self._next_ts_ns
+        self._next_ts_ns += self.frame_duration_ns
+        self.frame_count += 1
             
         return AudioFrame(
             data=data,
-            timestamp=time.time(),
-            sequence_number=self.frame_count,
+            timestamp_ns=timestamp_ns,
+            sequence_number=sequence_number,
             sample_rate=self.codec.rate,
             channels=self.codec.channels,
             frame_size=self.frame_size,
@@ -59,26 +116,42 @@ class FrameHandler:
         if not self.validate_frame(frame):
             return False
 
-        # Handle jitter
-        if self.frame_buffer:
-            last_frame = self.frame_buffer[-1]
-            jitter = abs((frame.timestamp - last_frame.timestamp) - self.frame_duration)
-            self.jitter_buffer.append(jitter)
-            self.current_jitter = statistics.mean(self.jitter_buffer) if self.jitter_buffer else 0
+        # Handle jitter. Measured on arrival: frame timestamps are derived
+        # from the frame duration, so their spacing never varies
+        arrival_ns = time.monotonic_ns()
+        if self._count:
+            jitter = abs((arrival_ns - self._last_arrival_ns) - self.frame_duration_ns)
+            self._jsum += jitter - self.jitter_buffer[self._jidx]
+            self.jitter_buffer[self._jidx] = jitter
+            self._jidx = (self._jidx + 1) % self.jitter_window
+            if self._jcount < self.jitter_window:
+                self._jcount += 1
+            self.current_jitter_ns = self._jsum // self._jcount
+        self._last_arrival_ns = arrival_ns
 
-        self.frame_buffer.append(frame)
+        self.frame_buffer[(self._head + self._count) % self.buffer_size] = frame
+        if self._count == self.buffer_size:
+            # Full, so the oldest frame was just overwritten
+            self._head = (self._head + 1) % self.buffer_size
+            self.buffer_overflow_count += 1
+        else:
+            self._count += 1
         return True
 
     def get_next_frame(self) -> Optional[AudioFrame]:
-        if not self.frame_buffer:
+        if not self._count:
+            self.buffer_underrun_count += 1
             return self._generate_silence_frame()
-        return self.frame_buffer.popleft()
+        frame = self.frame_buffer[self._head]
+        self.frame_buffer[self._head] = None
+        self._head = (self._head + 1) % self.buffer_size
+        self._count -= 1
+        return frame
 
     def _generate_silence_frame(self) -> AudioFrame:
-        silence_data = np.zeros(self.frame_size, dtype=np.int16).tobytes()
         return AudioFrame(
-            data=silence_data,
-            timestamp=time.time(),
+            data=self._silence_data,
+            timestamp_ns=time.monotonic_ns(),
             sequence_number=self.frame_count,
             sample_rate=self.codec.rate,
             channels=self.codec.channels,
@@ -93,9 +166,13 @@ class FrameHandler:
             frame.channels == self.codec.channels
         )
 
+    @property
+    def current_jitter(self) -> float:
+        return self.current_jitter_ns / 1e9
+
     def get_statistics(self):
         return {
             'total_frames': self.frame_count,
-            'buffer_level': len(self.frame_buffer),
+            'buffer_level': self._count,
             'current_jitter': self.current_jitter
         }
\ No newline at end of file
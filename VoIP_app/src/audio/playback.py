@@ -1,6 +1,7 @@
 import pyaudio
 from .frame_handler import FrameHandler, AudioFrame
 from .codec import AudioCodec
+from .audio_device import enumerate_devices, invalidate_device_cache, DeviceInfo, SUPPORTED_RATES
 
 class AudioPlayback:
     def __init__(self, device_index=None, rate=16000, channels=1):
@@ -12,23 +13,34 @@ class AudioPlayback:
         
         self.p = pyaudio.PyAudio()
         self.stream = None
+        self._devices = None  # Cached list_devices() result
         self.codec = AudioCodec(rate=rate, channels=channels)
         self.frame_handler = FrameHandler(codec=self.codec)
 
+    def reconfigure(self, device_index=None, rate=16000, channels=1):
+        """Select another device/format before start_stream, keeping the PyAudio instance"""
+        self.device_index = device_index
+        if rate != self.RATE or channels != self.CHANNELS:
+            self.RATE = rate
+            self.CHANNELS = channels
+            self.codec = AudioCodec(rate=rate, channels=channels)
+            self.frame_handler = FrameHandler(codec=self.codec)
+
     def list_devices(self):
-        devices = []
-        for i in range(self.p.get_device_count()):
-            dev = self.p.get_device_info_by_index(i)
-            if dev['maxOutputChannels'] > 0:
-                devices.append((
-                    i,
-                    dev['name'],
-                    dev['maxOutputChannels'],
-                    [8000, 16000, 44100, 48000]  # Supported rates
-                ))
-        return devices
+        if self._devices is None:
+            self._devices = tuple(
+                DeviceInfo(dev['index'], dev['name'], dev['maxOutputChannels'], SUPPORTED_RATES)
+                for dev in enumerate_devices(self.p)
+                if dev['maxOutputChannels'] > 0
+            )
+        return self._devices
+
+    def refresh_devices(self):
+        """Forget the cached device list so the next list_devices() rescans"""
+        invalidate_device_cache(self.p)
+        self._devices = None
 
-    def start_stream(self, retries=3):
+    def start_stream(self, retries=3, stream_callback=None):
         for _ in range(retries):
             try:
                 self.stream = self.p.open(
@@ -37,6 +49,7 @@ class AudioPlayback:
                     rate=self.RATE,
                     output=True,
                     output_device_index=self.device_index,
+                    stream_callback=stream_callback,
                     frames_per_buffer=self.FRAME_SIZE
                 )
                 return True
@@ -58,4 +71,5 @@ class AudioPlayback:
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
+        invalidate_device_cache(self.p)
         self.p.terminate()
\ No newline at end of file
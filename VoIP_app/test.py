@@ -38,11 +38,14 @@
 
 import opuslib
 
+# 20ms of silence at 48kHz stereo: 960 frames x 2 channels x 2 bytes
+_SILENCE_20MS_STEREO_48K = bytes(960 * 2 * 2)
+
 encoder = opuslib.Encoder(48000, 2, opuslib.APPLICATION_AUDIO)
 decoder = opuslib.Decoder(48000, 2)
 
 # Raw PCM bytes (dummy example)
-pcm_data = b'\x00\x00' * 960  # 20ms of silence at 48kHz stereo
+pcm_data = _SILENCE_20MS_STEREO_48K
 
 # Encode
 encoded = encoder.encode(pcm_data, frame_size=960)